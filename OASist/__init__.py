@@ -9,12 +9,29 @@ A comprehensive OpenAPI client generator with support for:
 - Automatic code formatting with Black
 """
 
+from typing import TYPE_CHECKING
+
 __all__ = [
     "ClientGenerator",
     "ServiceConfig",
     "CodeFormatter",
 ]
 
-from .oasist import ClientGenerator, ServiceConfig, CodeFormatter  # re-export for convenience
+if TYPE_CHECKING:
+    from .oasist import ClientGenerator, ServiceConfig, CodeFormatter
 
 __version__ = "1.1.0"
+
+
+def __getattr__(name):
+    """Lazily re-export from .oasist (PEP 562).
+    
+    `import OASist` (e.g. to read __version__) no longer loads rich, requests and
+    the generator stack; they are imported on first access to an exported name.
+    """
+    if name in __all__:
+        from . import oasist
+        value = getattr(oasist, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,19 +14,20 @@ Architecture Notes:
 - For advanced use cases, the modular design allows programmatic usage
 """
 import subprocess
-import requests
-import yaml
 import json
 import logging
+import math
 import os
 import re
 import shutil
 import tempfile
 import sys
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional, Dict, Any, Protocol, Generator, List
+from typing import Optional, Dict, Any, Protocol, Generator, List, Mapping, Union
 from dataclasses import dataclass, field
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from abc import ABC, abstractmethod
 from urllib.parse import urlparse
@@ -36,24 +37,40 @@ from rich.console import Console
 from rich.theme import Theme
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
 from rich.logging import RichHandler
 from rich import box
 from rich.text import Text
 from rich.rule import Rule
 from rich.align import Align
 
+# PyYAML is imported on first use (see _get_yaml) to keep CLI startup fast
+_yaml = None
+
+# Optional fast JSON backend (pip install oasist[speedups])
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 OUTPUT_DIR = "./clients"
 CONFIG_FILE = "oasist_config.json"
+YAML_SUFFIXES = ('.yaml', '.yml')
 HTTP_TIMEOUT = 30  # seconds
 RICH_THEME = Theme({
     "info": "bold cyan", "warning": "bold yellow", "error": "bold red",
     "success": "bold green", "accent": "bold magenta", "dim": "dim"
 })
 
+# ${VAR} or ${VAR:default} placeholders
+ENV_VAR_PATTERN = re.compile(r'\$\{([^}:]+)(?::([^}]*))?\}')
+# Leading '{' of a document that may be a JSON object (checked without copying the text)
+JSON_OBJECT_START = re.compile(r'\s*\{')
+# A `security` key in a raw JSON/YAML document (but not `securitySchemes`)
+SECURITY_KEY_PATTERN = re.compile(rb'\bsecurity["\']?\s*:')
+
 # Command names
 CMD_LIST = "list"
 CMD_GENERATE = "generate"
@@ -71,59 +88,162 @@ logging.basicConfig(level=logging.INFO, format='%(message)s',
 logger = logging.getLogger("oasist")
 load_dotenv()
 
+# Service being generated in the current thread; prefixed to log records so
+# interleaved output from generate_all workers can be traced to a service
+_current_service: ContextVar[Optional[str]] = ContextVar("oasist_current_service", default=None)
+
+class ServiceLogFilter(logging.Filter):
+    """Prefix log records with the service currently being generated."""
+    def filter(self, record: logging.LogRecord) -> bool:
+        service = _current_service.get()
+        if service:
+            record.msg = f"[{service}] {record.getMessage()}"
+            record.args = ()
+        return True
+
+logger.addFilter(ServiceLogFilter())
+
 # ============================================================================
 # UTILITIES
 # ============================================================================
-def substitute_env_vars(text: str) -> str:
+def status(message: str, spinner: str = "dots", show: bool = True):
+    """console.status() spinner, or a no-op when show is False.
+    
+    Rich only tracks nested Live displays correctly when they stop in reverse
+    order, so callers running inside generate_all's progress bar pass show=False.
+    """
+    return console.status(message, spinner=spinner) if show else nullcontext()
+
+def _replace_env_var(match: re.Match, env: Mapping[str, str]) -> str:
+    """Resolve a single ${VAR} or ${VAR:default} match against env."""
+    var_name = match.group(1)
+    default_value = match.group(2)
+    env_value = env.get(var_name)
+    
+    if env_value is not None:
+        return env_value
+    elif default_value is not None:
+        return default_value
+    else:
+        logger.warning(f"Environment variable '{var_name}' not found and no default provided")
+        return match.group(0)  # Return original placeholder
+
+def substitute_env_vars(text: str, env: Optional[Mapping[str, str]] = None) -> str:
     """Replace ${VAR} or ${VAR:default} with env values.
     
     Warns if environment variable is not found and no default is provided.
+    
+    Args:
+        text: String to process
+        env: Variables to resolve against (defaults to os.environ)
     """
-    if not isinstance(text, str):
+    if not isinstance(text, str) or '${' not in text:
         return text
-    
-    def replace_var(match):
-        var_name = match.group(1)
-        default_value = match.group(2)
-        env_value = os.getenv(var_name)
-        
-        if env_value is not None:
-            return env_value
-        elif default_value is not None:
-            return default_value
-        else:
-            logger.warning(f"Environment variable '{var_name}' not found and no default provided")
-            return match.group(0)  # Return original placeholder
-    
-    return re.sub(r'\$\{([^}:]+)(?::([^}]*))?\}', replace_var, text)
+    if env is None:
+        env = os.environ
+    return ENV_VAR_PATTERN.sub(lambda match: _replace_env_var(match, env), text)
 
-def substitute_recursive(data: Any) -> Any:
-    """Recursively substitute environment variables in nested data structures.
+def substitute_recursive(data: Any, env: Optional[Mapping[str, str]] = None) -> Any:
+    """Substitute environment variables in nested data structures in place.
     
-    Traverses dictionaries, lists, and strings to replace ${VAR} or ${VAR:default}
-    patterns with environment variable values.
+    Walks dictionaries and lists iteratively (no recursion, no copies) and
+    replaces ${VAR} or ${VAR:default} patterns in string leaves.
     
     Args:
         data: Data structure (str, dict, list, or primitive) to process
+        env: Variables to resolve against (defaults to a snapshot of os.environ
+            taken once for the whole pass, on the first placeholder found)
         
     Returns:
-        Processed data with environment variables substituted
+        The same container with environment variables substituted, or the
+        substituted value when data is a string
     """
     if isinstance(data, str):
-        return substitute_env_vars(data)
-    if isinstance(data, dict):
-        return {k: substitute_recursive(v) for k, v in data.items()}
-    if isinstance(data, list):
-        return [substitute_recursive(item) for item in data]
+        return substitute_env_vars(data, env)
+    
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            items = node.items()
+        elif isinstance(node, list):
+            items = enumerate(node)
+        else:
+            continue
+        for key, value in items:
+            if isinstance(value, str):
+                if '${' in value:
+                    if env is None:
+                        env = dict(os.environ)
+                    node[key] = substitute_env_vars(value, env)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
     return data
 
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON from str or UTF-8 bytes, using orjson when installed.
+    
+    orjson turns integers beyond 64 bits into floats, so use this for config
+    files only; schemas go through JSONParser (stdlib json) to stay lossless.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _has_non_finite_float(content: Any) -> bool:
+    """Check nested dicts/lists for NaN or +/-Infinity, which orjson writes as null."""
+    stack = [content]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, float):
+            if not math.isfinite(node):
+                return True
+        elif isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return False
+
+def json_dumps(content: Any) -> bytes:
+    """Encode content as indented UTF-8 JSON bytes, using orjson when installed.
+    
+    Falls back to stdlib json wherever orjson would be lossy (non-finite floats)
+    or refuses the content (integers beyond 64 bits).
+    """
+    if orjson is not None and not _has_non_finite_float(content):
+        try:
+            # Match json.dumps, which writes non-string keys (e.g. 200) as strings
+            return orjson.dumps(content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(content, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _get_yaml():
+    """Import PyYAML once, on first use."""
+    global _yaml
+    if _yaml is None:
+        import yaml
+        _yaml = yaml
+    return _yaml
+
+def yaml_load(text: Union[str, bytes]) -> Any:
+    """Parse YAML, using libyaml's C loader when PyYAML was built against it."""
+    yaml = _get_yaml()
+    return yaml.load(text, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+def yaml_dumps(content: Any) -> bytes:
+    """Encode content as UTF-8 YAML bytes, using libyaml's C dumper when available."""
+    yaml = _get_yaml()
+    return yaml.dump(content, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper), encoding='utf-8',
+                     sort_keys=False, allow_unicode=True)
+
 @contextmanager
-def temp_file(content: Dict[str, Any], as_json: bool = True) -> Generator[Path, None, None]:
+def temp_file(content: Union[Dict[str, Any], bytes], as_json: bool = True) -> Generator[Path, None, None]:
     """Context manager for temp files with auto cleanup.
     
     Args:
-        content: Dictionary content to write to file
-        as_json: If True, write as JSON; otherwise write as YAML
+        content: Dictionary content to serialize, or already-encoded bytes to write verbatim
+        as_json: If True, write as JSON; otherwise write as YAML (also picks the file suffix)
         
     Yields:
         Path to the temporary file
@@ -132,32 +252,29 @@ def temp_file(content: Dict[str, Any], as_json: bool = True) -> Generator[Path,
         IOError: If file creation/write operations fail
     """
     suffix = '.json' if as_json else '.yaml'
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix, mode='w', encoding='utf-8')
-    tmp_path = Path(tmp.name)
+    if isinstance(content, bytes):
+        data = content
+    elif as_json:
+        data = json_dumps(content)
+    else:
+        data = yaml_dumps(content)
     
     try:
-        # Write content to file
-        if as_json:
-            json.dump(content, tmp, ensure_ascii=False, indent=2)
-        else:
-            yaml.safe_dump(content, tmp, sort_keys=False, allow_unicode=True)
-        tmp.flush()  # Ensure data is written
-        tmp.close()  # Close file handle before yielding
+        fd, name = tempfile.mkstemp(suffix=suffix)
+    except OSError as e:
+        raise IOError(f"Failed to create temporary file: {e}") from e
+    tmp_path = Path(name)
+    
+    try:
+        try:
+            # Write pre-encoded bytes straight to the fd; loops only on a short write
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)  # Close file handle before yielding
         
         yield tmp_path
-    except Exception as e:
-        # Close file if still open (during file creation)
-        try:
-            tmp.close()
-        except:
-            pass
-        # Only wrap IOError for file operations, not user code exceptions
-        if tmp_path.exists():
-            # File was created successfully, user code raised exception
-            raise
-        else:
-            # File creation failed
-            raise IOError(f"Failed to create temporary file: {e}") from e
     finally:
         # Always cleanup temp file
         tmp_path.unlink(missing_ok=True)
@@ -167,22 +284,22 @@ def temp_file(content: Dict[str, Any], as_json: bool = True) -> Generator[Path,
 # ============================================================================
 class SchemaParser(Protocol):
     """Protocol for schema parsing strategies."""
-    def parse(self, text: str) -> Dict[str, Any]: ...
+    def parse(self, text: Union[str, bytes]) -> Dict[str, Any]: ...
 
 class JSONParser:
     """JSON schema parser."""
-    def parse(self, text: str) -> Dict[str, Any]:
+    def parse(self, text: Union[str, bytes]) -> Dict[str, Any]:
         return json.loads(text)
 
 class YAMLParser:
     """YAML schema parser."""
-    def parse(self, text: str) -> Dict[str, Any]:
-        return yaml.safe_load(text)
+    def parse(self, text: Union[str, bytes]) -> Dict[str, Any]:
+        return yaml_load(text)
 
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
-@dataclass
+@dataclass(slots=True)
 class ServiceConfig:
     """Service configuration with auto env var substitution and validation."""
     name: str
@@ -199,13 +316,19 @@ class ServiceConfig:
     
     def __post_init__(self):
         """Auto-substitute env vars, validate, and generate defaults."""
-        # Substitute environment variables in strings
+        # Substitute environment variables in strings, snapshotting os.environ
+        # only if some field actually has a placeholder
+        env = None
         for attr in ('name', 'schema_url', 'output_dir', 'package_name', 'base_url'):
-            setattr(self, attr, substitute_env_vars(getattr(self, attr)))
+            value = getattr(self, attr)
+            if isinstance(value, str) and '${' in value:
+                if env is None:
+                    env = dict(os.environ)
+                setattr(self, attr, substitute_env_vars(value, env))
         
         # Substitute environment variables in dictionaries
-        self.request_params = substitute_recursive(self.request_params)
-        self.request_headers = substitute_recursive(self.request_headers)
+        self.request_params = substitute_recursive(self.request_params, env)
+        self.request_headers = substitute_recursive(self.request_headers, env)
         
         # Validate required fields
         if not self.name or not self.name.strip():
@@ -245,6 +368,13 @@ class ServiceConfig:
         if '..' in self.output_dir or output_path.is_absolute() or is_unix_absolute:
             raise ValueError(f"Output directory must be relative and cannot contain '..': '{self.output_dir}'")
 
+@dataclass(slots=True)
+class FetchedSchema:
+    """Parsed schema together with the document it was parsed from."""
+    schema: Dict[str, Any]
+    raw: bytes  # Response body, UTF-8 encoded
+    is_json: bool  # True if the document was JSON rather than YAML
+
 # ============================================================================
 # SCHEMA PROCESSOR
 # ============================================================================
@@ -254,7 +384,8 @@ class SchemaProcessor:
     HTTP_METHODS = {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
     
     @staticmethod
-    def fetch(url: str, params: Dict[str, str], prefer_json: bool, custom_headers: Dict[str, str] = None) -> Optional[Dict[str, Any]]:
+    def fetch(url: str, params: Dict[str, str], prefer_json: bool, custom_headers: Dict[str, str] = None,
+              show_status: bool = True) -> Optional[Dict[str, Any]]:
         """Fetch schema with format preference and retry logic.
         
         Args:
@@ -262,10 +393,31 @@ class SchemaProcessor:
             params: Query parameters for the request
             prefer_json: If True, prefer JSON format over YAML
             custom_headers: Optional custom headers to include in request
+            show_status: Whether to show a spinner while fetching
             
         Returns:
             Parsed schema dictionary or None on failure
         """
+        fetched = SchemaProcessor.fetch_raw(url, params, prefer_json, custom_headers, show_status)
+        return fetched.schema if fetched else None
+    
+    @staticmethod
+    def fetch_raw(url: str, params: Dict[str, str], prefer_json: bool,
+                  custom_headers: Dict[str, str] = None, show_status: bool = True) -> Optional[FetchedSchema]:
+        """Fetch schema like fetch(), also returning the raw document and its format.
+        
+        Args:
+            url: URL to fetch schema from
+            params: Query parameters for the request
+            prefer_json: If True, prefer JSON format over YAML
+            custom_headers: Optional custom headers to include in request
+            show_status: Whether to show a spinner while fetching
+            
+        Returns:
+            FetchedSchema or None on failure
+        """
+        import requests
+        
         headers = {'Accept': 'application/vnd.oai.openapi+json, application/json' if prefer_json 
                    else 'application/yaml, text/yaml, application/x-yaml, text/plain'}
         
@@ -273,37 +425,44 @@ class SchemaProcessor:
         if custom_headers:
             headers.update(custom_headers)
         
-        with console.status("[accent]Fetching schema...", spinner="dots"):
+        with status("[accent]Fetching schema...", show=show_status):
             try:
                 response = requests.get(url, headers=headers, params=params, timeout=HTTP_TIMEOUT)
                 response.raise_for_status()
                 
+                # Decode once: requests re-decodes (and may sniff the charset) on every .text access
+                text = response.text
+                
                 # Check if response is empty
-                if not response.text or not response.text.strip():
+                if not text or text.isspace():
                     logger.error("Received empty response from schema URL")
                     return None
                 
-                # Try preferred format first, then fallback
-                parsers = ([JSONParser(), YAMLParser()] if prefer_json or url.lower().endswith('.json')
+                # Try preferred format first, then fallback; a leading '{' suggests JSON
+                looks_json = JSON_OBJECT_START.match(text) is not None
+                parsers = ([JSONParser(), YAMLParser()] if prefer_json or looks_json or url.lower().endswith('.json')
                           else [YAMLParser(), JSONParser()])
                 
                 last_error = None
                 for i, parser in enumerate(parsers):
                     try:
-                        schema = parser.parse(response.text)
+                        schema = parser.parse(text)
                         if schema and isinstance(schema, dict):
                             # Validate schema has required OpenAPI fields
                             if not schema.get('openapi') and not schema.get('swagger'):
                                 logger.warning("Schema missing 'openapi' or 'swagger' version field")
                             if not schema.get('paths') and not schema.get('webhooks'):
                                 logger.warning("Schema has no 'paths' or 'webhooks' defined")
-                            return schema
+                            # Only the JSON parser's success proves JSON; YAML also accepts
+                            # JSON and flow-style YAML starts with '{' too
+                            return FetchedSchema(schema=schema, raw=text.encode('utf-8'),
+                                                 is_json=isinstance(parser, JSONParser))
                         elif schema is not None:
                             logger.error(f"Schema is not a dictionary: {type(schema)}")
                     except json.JSONDecodeError as e:
                         last_error = f"JSON parsing failed: {e}"
                         logger.debug(f"Parser {i+1} (JSON) failed: {e}")
-                    except yaml.YAMLError as e:
+                    except _get_yaml().YAMLError as e:
                         last_error = f"YAML parsing failed: {e}"
                         logger.debug(f"Parser {i+1} (YAML) failed: {e}")
                     except Exception as e:
@@ -329,11 +488,30 @@ class SchemaProcessor:
                 return None
     
     @staticmethod
-    def sanitize_security(schema: Dict[str, Any]) -> Dict[str, Any]:
+    def sanitize_security(schema: Dict[str, Any], raw_bytes: Optional[bytes] = None) -> Dict[str, Any]:
         """Normalize invalid security requirement formats to OpenAPI spec."""
+        SchemaProcessor.normalize_security(schema, raw_bytes)
+        return schema
+    
+    @staticmethod
+    def normalize_security(schema: Dict[str, Any], raw_bytes: Optional[bytes] = None) -> bool:
+        """Normalize security requirements in place.
+        
+        Args:
+            schema: Parsed OpenAPI schema
+            raw_bytes: Document the schema was parsed from; when given and it has no
+                `security` key at all, the walk over paths is skipped
+            
+        Returns:
+            True if any operation's security was rewritten, False if the schema was already valid
+        """
+        changed = False
+        if raw_bytes is not None and not SECURITY_KEY_PATTERN.search(raw_bytes):
+            return changed
+        
         paths = schema.get('paths', {})
         if not isinstance(paths, dict):
-            return schema
+            return changed
         
         for path_item in paths.values():
             if not isinstance(path_item, dict):
@@ -345,12 +523,17 @@ class SchemaProcessor:
                 security = op.get('security')
                 if isinstance(security, dict):
                     # Convert dict to list of separate requirements (OR logic)
-                    op['security'] = [{k: []} for k in security.keys()]
+                    normalized = [{k: []} for k in security.keys()]
                 elif isinstance(security, list):
-                    op['security'] = [{k: v if isinstance(v, list) else [] 
-                                      for k, v in req.items()} 
-                                     for req in security if isinstance(req, dict)]
-        return schema
+                    normalized = [{k: v if isinstance(v, list) else [] 
+                                  for k, v in req.items()} 
+                                 for req in security if isinstance(req, dict)]
+                else:
+                    continue
+                if normalized != security:
+                    op['security'] = normalized
+                    changed = True
+        return changed
 
 # ============================================================================
 # CODE FORMATTER
@@ -377,11 +560,12 @@ class CodeFormatter:
             return False
     
     @staticmethod
-    def format_directory(directory: Path) -> bool:
+    def format_directory(directory: Path, show_status: bool = True) -> bool:
         """Format all Python files in directory using Black.
         
         Args:
             directory: Directory containing Python files to format
+            show_status: Whether to show a spinner while formatting
             
         Returns:
             True if formatting succeeded or was skipped, False on error
@@ -397,7 +581,7 @@ class CodeFormatter:
             return True  # Not an error, just skip formatting
         
         try:
-            with console.status("[accent]Formatting code with Black...", spinner="dots"):
+            with status("[accent]Formatting code with Black...", show=show_status):
                 result = subprocess.run(
                     ['black', '--quiet', str(directory)],
                     capture_output=True,
@@ -427,13 +611,14 @@ class GeneratorRunner:
     """Runs openapi-python-client with retry logic and error handling."""
     
     @staticmethod
-    def run(schema_path: Path, output_path: Path, disable_hooks: bool) -> bool:
+    def run(schema_path: Path, output_path: Path, disable_hooks: bool, show_status: bool = True) -> bool:
         """Execute generator with automatic retries.
         
         Args:
             schema_path: Path to OpenAPI schema file
             output_path: Output directory for generated client
             disable_hooks: Whether to disable post-generation hooks
+            show_status: Whether to show a spinner while generating
             
         Returns:
             True if generation succeeded, False otherwise
@@ -445,37 +630,39 @@ class GeneratorRunner:
         ]
         
         if disable_hooks:
-            return GeneratorRunner._run_with_hooks_disabled(base_cmd)
+            return GeneratorRunner._run_with_hooks_disabled(base_cmd, show_status)
         else:
-            return GeneratorRunner._run_default(base_cmd)
+            return GeneratorRunner._run_default(base_cmd, show_status)
     
     @staticmethod
-    def _run_with_hooks_disabled(base_cmd: list) -> bool:
+    def _run_with_hooks_disabled(base_cmd: list, show_status: bool = True) -> bool:
         """Run generator with post-hooks disabled.
         
         Args:
             base_cmd: Base command list for generator
+            show_status: Whether to show a spinner while generating
             
         Returns:
             True if generation succeeded, False otherwise
         """
         with temp_file({"post_hooks": []}, as_json=False) as config_path:
             cmd = base_cmd + ['--config', str(config_path)]
-            result = GeneratorRunner._execute(cmd)
+            result = GeneratorRunner._execute(cmd, show_status)
         
         return GeneratorRunner._check_result(result)
     
     @staticmethod
-    def _run_default(base_cmd: list) -> bool:
+    def _run_default(base_cmd: list, show_status: bool = True) -> bool:
         """Run generator with default settings, retry on ruff failure.
         
         Args:
             base_cmd: Base command list for generator
+            show_status: Whether to show a spinner while generating
             
         Returns:
             True if generation succeeded, False otherwise
         """
-        result = GeneratorRunner._execute(base_cmd)
+        result = GeneratorRunner._execute(base_cmd, show_status)
         stderr_lower = result.stderr.lower() if result.stderr else ""
         
         # Retry with hooks disabled if ruff failed
@@ -483,21 +670,22 @@ class GeneratorRunner:
             logger.warning("Ruff failed, retrying with hooks disabled")
             with temp_file({"post_hooks": []}, as_json=False) as config_path:
                 cmd = base_cmd + ['--config', str(config_path)]
-                result = GeneratorRunner._execute(cmd)
+                result = GeneratorRunner._execute(cmd, show_status)
         
         return GeneratorRunner._check_result(result)
     
     @staticmethod
-    def _execute(cmd: list) -> subprocess.CompletedProcess:
+    def _execute(cmd: list, show_status: bool = True) -> subprocess.CompletedProcess:
         """Execute subprocess command with UI spinner.
         
         Args:
             cmd: Command list to execute
+            show_status: Whether to show the spinner
             
         Returns:
             CompletedProcess instance with stdout and stderr
         """
-        with console.status("[accent]Generating client...", spinner="bouncingBar"):
+        with status("[accent]Generating client...", spinner="bouncingBar", show=show_status):
             return subprocess.run(cmd, capture_output=True, text=True)
     
     @staticmethod
@@ -536,16 +724,25 @@ class ClientGenerator:
         """Register service."""
         self.services[key] = config
     
-    def generate(self, service_key: str, force: bool = False) -> bool:
+    def generate(self, service_key: str, force: bool = False, show_status: bool = True) -> bool:
         """Generate client for service.
         
         Args:
             service_key: Service identifier from configuration
             force: If True, regenerate even if client exists
+            show_status: Whether to show per-step spinners (off inside generate_all's progress bar)
             
         Returns:
             True if generation succeeded, False otherwise
         """
+        token = _current_service.set(service_key)
+        try:
+            return self._generate(service_key, force, show_status)
+        finally:
+            _current_service.reset(token)
+    
+    def _generate(self, service_key: str, force: bool, show_status: bool) -> bool:
+        """Generate client for service; see generate()."""
         config = self.services.get(service_key)
         if not config:
             logger.error(f"Service '{service_key}' not found")
@@ -576,19 +773,20 @@ class ClientGenerator:
             return False
         
         # Fetch and process schema
-        schema = SchemaProcessor.fetch(config.schema_url, config.request_params, config.prefer_json, config.request_headers)
-        if not schema:
+        fetched = SchemaProcessor.fetch_raw(config.schema_url, config.request_params, config.prefer_json,
+                                            config.request_headers, show_status)
+        if not fetched:
             return False
-        schema = SchemaProcessor.sanitize_security(schema)
+        # Pass the document through verbatim unless sanitizing had to rewrite it
+        content = fetched.schema if SchemaProcessor.normalize_security(fetched.schema, fetched.raw) else fetched.raw
         
         # Clean output directory
         if output_path.exists():
             shutil.rmtree(output_path)
         
-        # Generate client
-        is_json = config.prefer_json or config.schema_url.lower().endswith('.json')
-        with temp_file(schema, as_json=is_json) as schema_path:
-            success = GeneratorRunner.run(schema_path, output_path, config.disable_post_hooks)
+        # Generate client, keeping the schema in the format it was served in
+        with temp_file(content, as_json=fetched.is_json) as schema_path:
+            success = GeneratorRunner.run(schema_path, output_path, config.disable_post_hooks, show_status)
         
         if not success:
             if output_path.exists() and output_path.is_dir() and not any(output_path.iterdir()):
@@ -597,16 +795,22 @@ class ClientGenerator:
         
         # Format generated code with Black if enabled
         if config.format_with_black:
-            CodeFormatter.format_directory(output_path)
+            CodeFormatter.format_directory(output_path, show_status)
         
         console.print(f":sparkles: [success]Generated[/success] [accent]{service_key}[/accent] → [bold]{output_path}[/bold]")
         return True
     
-    def generate_all(self, force: bool = False) -> int:
-        """Generate all clients with progress bar.
+    def generate_all(self, force: bool = False, max_workers: Optional[int] = None) -> int:
+        """Generate all clients concurrently with progress bar.
+        
+        Each service fetches its schema and shells out to its own generator
+        process writing to its own output directory, so services run in a
+        thread pool.
         
         Args:
             force: If True, regenerate even if client exists
+            max_workers: Number of services to generate at once
+                (default: min(service count, CPU count); 1 runs serially)
             
         Returns:
             Number of successfully generated clients
@@ -615,20 +819,45 @@ class ClientGenerator:
             logger.warning("No services configured - nothing to generate")
             return 0
         
+        from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
+        
         total, success_count = len(self.services), 0
+        workers = max_workers or min(total, os.cpu_count() or 1)
+        
+        # Services sharing or nesting output dirs would rmtree each other mid-generation
+        if workers > 1 and self._has_overlapping_outputs():
+            logger.warning("Services share or nest output directories - generating one at a time")
+            workers = 1
         
         with Progress(SpinnerColumn(style="accent"), TextColumn("[accent]Generating[/accent]"),
                      BarColumn(bar_width=None), TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                     TimeElapsedColumn(), console=console, transient=True) as progress:
+                     TimeElapsedColumn(), console=console, transient=True) as progress, \
+                ThreadPoolExecutor(max_workers=workers) as executor:
             task_id = progress.add_task("generate_all", total=total)
-            for key in self.services:
-                if self.generate(key, force):
-                    success_count += 1
-                progress.advance(task_id, 1)
+            # The progress bar is the only Live display; per-service spinners would clobber it
+            futures = [executor.submit(self.generate, key, force, False) for key in self.services]
+            try:
+                for future in as_completed(futures):
+                    if future.result():
+                        success_count += 1
+                    progress.advance(task_id, 1)
+            except BaseException:
+                # Stop at the first error or Ctrl-C like the serial loop did: let
+                # in-flight services finish but never start the queued ones
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
         
         console.print(f"[success]✓ Generated {success_count}/{total} clients")
         return success_count
     
+    def _has_overlapping_outputs(self) -> bool:
+        """Check whether any two services write to the same or nested output directories."""
+        paths = [(self.output_base / config.output_dir).resolve() for config in self.services.values()]
+        path_set = set(paths)
+        if len(path_set) < len(paths):
+            return True
+        return any(parent in path_set for path in paths for parent in path.parents)
+    
     def list_services(self) -> None:
         """Display all services."""
         if not self.services:
@@ -682,7 +911,7 @@ class ConfigLoader:
     
     @staticmethod
     def load(generator: ClientGenerator, config_file: str) -> bool:
-        """Load services from config file."""
+        """Load services from config file (JSON, or YAML by .yaml/.yml suffix)."""
         config_path = Path(config_file)
         
         if not config_path.exists():
@@ -691,8 +920,11 @@ class ConfigLoader:
             return False
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = substitute_recursive(json.load(f))
+            raw = config_path.read_bytes()
+            config_data = yaml_load(raw) if config_path.suffix.lower() in YAML_SUFFIXES else json_loads(raw)
+            # Skip the tree walk entirely when the file has no placeholders
+            if b'${' in raw:
+                config_data = substitute_recursive(config_data)
         except FileNotFoundError:
             logger.error(f"Config file not found: {config_file}")
             return False
@@ -702,6 +934,9 @@ class ConfigLoader:
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in config file (line {e.lineno}, col {e.colno}): {e.msg}")
             return False
+        except _get_yaml().YAMLError as e:
+            logger.error(f"Invalid YAML in config file: {e}")
+            return False
         except UnicodeDecodeError as e:
             logger.error(f"Invalid encoding in config file (expected UTF-8): {e}")
             return False
@@ -709,6 +944,10 @@ class ConfigLoader:
             logger.error(f"Unexpected error loading config: {type(e).__name__}: {e}")
             return False
         
+        if not isinstance(config_data, dict):
+            logger.error(f"Config file must contain a mapping at top level: {config_file}")
+            return False
+        
         if 'output_dir' in config_data:
             generator.output_base = Path(config_data['output_dir'])
         
@@ -722,6 +961,31 @@ class ConfigLoader:
         logger.info(f"✓ Loaded {services_loaded} services from {config_file}")
         return True
     
+    @staticmethod
+    def _str(value: Any) -> str:
+        """Coerce a config scalar to str (YAML yields ints, floats, bools and None too)."""
+        return '' if value is None else str(value)
+    
+    @staticmethod
+    def _str_mapping(value: Any, field_name: str, query_params: bool = False) -> Dict[str, Any]:
+        """Coerce a params/headers mapping to str keys and values.
+        
+        With query_params, lists and None are kept as requests gives them meaning
+        (repeated params and omitted params); only list elements are coerced.
+        
+        Raises:
+            ValueError: If value is not a mapping
+        """
+        if not value:
+            return {}
+        if not isinstance(value, dict):
+            raise ValueError(f"'{field_name}' must be a mapping")
+        if not query_params:
+            return {str(k): ConfigLoader._str(v) for k, v in value.items()}
+        return {str(k): ([str(item) for item in v] if isinstance(v, list)
+                         else v if v is None else str(v))
+                for k, v in value.items()}
+    
     @staticmethod
     def _load_projects(generator: ClientGenerator, projects: Dict[str, Any]) -> int:
         """Load Orval-style projects.
@@ -735,20 +999,23 @@ class ConfigLoader:
         """
         count = 0
         for key, proj in projects.items():
+            key = str(key)
             if not isinstance(proj, dict):
                 continue
             input_cfg = proj.get('input', {}) or {}
             output_cfg = proj.get('output', {}) or {}
             
             try:
+                if not isinstance(input_cfg, dict) or not isinstance(output_cfg, dict):
+                    raise ValueError("'input' and 'output' must be mappings")
                 config = ServiceConfig(
-                    name=output_cfg.get('name', key),
-                    schema_url=input_cfg.get('target', ''),
-                    output_dir=output_cfg.get('dir', key),
-                    base_url=output_cfg.get('base_url', ''),
-                    package_name=output_cfg.get('package_name', ''),
-                    request_params=input_cfg.get('params', {}) or {},
-                    request_headers=input_cfg.get('headers', {}) or {},
+                    name=ConfigLoader._str(output_cfg.get('name', key)),
+                    schema_url=ConfigLoader._str(input_cfg.get('target', '')),
+                    output_dir=ConfigLoader._str(output_cfg.get('dir', key)),
+                    base_url=ConfigLoader._str(output_cfg.get('base_url', '')),
+                    package_name=ConfigLoader._str(output_cfg.get('package_name', '')),
+                    request_params=ConfigLoader._str_mapping(input_cfg.get('params'), 'params', query_params=True),
+                    request_headers=ConfigLoader._str_mapping(input_cfg.get('headers'), 'headers'),
                     prefer_json=bool(input_cfg.get('prefer_json', False)),
                     disable_post_hooks=bool(output_cfg.get('disable_post_hooks', True)),
                     format_with_black=bool(output_cfg.get('format_with_black', True)),
@@ -772,19 +1039,20 @@ class ConfigLoader:
         """
         count = 0
         for service in services:
-            key = service.get('key')
+            key = ConfigLoader._str(service.get('key'))
             if not key:
                 logger.warning("Skipping service without 'key' field")
                 continue
             try:
                 config = ServiceConfig(
-                    name=service.get('name', key),
-                    schema_url=service.get('schema_url', ''),
-                    output_dir=service.get('output_dir', key),
-                    base_url=service.get('base_url', ''),
-                    package_name=service.get('package_name', ''),
-                    request_params=service.get('request_params', {}) or {},
-                    request_headers=service.get('request_headers', {}) or {},
+                    name=ConfigLoader._str(service.get('name', key)),
+                    schema_url=ConfigLoader._str(service.get('schema_url', '')),
+                    output_dir=ConfigLoader._str(service.get('output_dir', key)),
+                    base_url=ConfigLoader._str(service.get('base_url', '')),
+                    package_name=ConfigLoader._str(service.get('package_name', '')),
+                    request_params=ConfigLoader._str_mapping(service.get('request_params'), 'request_params',
+                                                             query_params=True),
+                    request_headers=ConfigLoader._str_mapping(service.get('request_headers'), 'request_headers'),
                     prefer_json=bool(service.get('prefer_json', False)),
                     disable_post_hooks=bool(service.get('disable_post_hooks', True)),
                     format_with_black=bool(service.get('format_with_black', True)),
@@ -821,7 +1089,17 @@ class GenerateCommand(Command):
 class GenerateAllCommand(Command):
     """Generate all services command."""
     def execute(self, generator: ClientGenerator, args: list) -> None:
-        generator.generate_all('--force' in args)
+        max_workers = None
+        for flag in ('--jobs', '-j'):
+            if flag in args:
+                idx = args.index(flag)
+                value = args[idx + 1] if idx + 1 < len(args) else ''
+                if not value.isdigit() or int(value) < 1:
+                    console.print(Panel.fit(f"Invalid value for {flag}: expected a positive integer", 
+                                           title="Error", style="error"))
+                    return
+                max_workers = int(value)
+        generator.generate_all('--force' in args, max_workers)
 
 class InfoCommand(Command):
     """Show service info command."""
@@ -877,6 +1155,7 @@ class HelpDisplay:
             ("--help, -h", "Show help"),
             ("--version, -V", "Show version"),
             ("--force", "Regenerate existing clients"),
+            ("--jobs, -j <n>", "Parallel generations for generate-all (default: services, up to CPU count)"),
             ("", ""),
             ("[bold]EXAMPLES[/bold]", ""),
             ("oasist list", "List services"),
@@ -884,6 +1163,7 @@ class HelpDisplay:
             ("oasist -c prod.json generate myapi", "Use custom config"),
             ("oasist generate myapi --force", "Force regenerate"),
             ("oasist generate-all", "Generate all"),
+            ("oasist generate-all -j 1", "Generate all, one at a time"),
             ("oasist info myapi", "Show service info"),
         ]
         
@@ -902,8 +1182,9 @@ class HelpDisplay:
             'list': ('List configured services', 'oasist list', None),
             'generate': ('Generate client for service', 'oasist generate <service> [--force]', 
                         ['--force: Regenerate if exists']),
-            'generate-all': ('Generate all clients', 'oasist generate-all [--force]', 
-                           ['--force: Regenerate if exists']),
+            'generate-all': ('Generate all clients', 'oasist generate-all [--force] [--jobs N]', 
+                           ['--force: Regenerate if exists',
+                            '--jobs, -j N: Generate N services at once (default: services, up to CPU count)']),
             'info': ('Show service details', 'oasist info <service>', None),
         }
         